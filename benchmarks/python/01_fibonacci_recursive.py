@@ -1,28 +1,122 @@
+import ctypes
+import gc
+import os
+import platform
+import subprocess
+import tempfile
 import time
+from functools import lru_cache
+
+njit = None
+# PyPy runs only the pure-Python paths; C extensions go through its slow cpyext layer
+if platform.python_implementation() != "PyPy":
+    try:
+        from numba import njit
+    except ImportError:
+        pass
 
 def fib(n):
     if n <= 1:
         return n
     return fib(n - 1) + fib(n - 2)
 
-# Warmup
-fib(20)
+@lru_cache(maxsize=None)
+def fib_memo(n):
+    if n <= 1:
+        return n
+    return fib_memo(n - 1) + fib_memo(n - 2)
+
+def _fib_pair(n):
+    # Fast doubling: returns (F(n), F(n+1)) in O(log n) exact integer steps
+    if n == 0:
+        return (0, 1)
+    a, b = _fib_pair(n >> 1)
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    return (d, c + d) if n & 1 else (c, d)
+
+def fib_doubling(n):
+    return _fib_pair(n)[0]
+
+if njit is not None:
+    @njit("int64(int64)", cache=True)
+    def fib_jit(n):
+        if n <= 1:
+            return n
+        return fib_jit(n - 1) + fib_jit(n - 2)
+else:
+    fib_jit = None
+
+FIB_C = "long long fib(int n){return n<2?n:fib(n-1)+fib(n-2);}\n"
+
+def _build_fib():
+    # Compile the same recursion as a shared library; None if it can't be
+    # built or loaded. The loaded library stays mapped after the directory
+    # is removed.
+    with tempfile.TemporaryDirectory(prefix="tova_fib_") as build_dir:
+        src = os.path.join(build_dir, "fib.c")
+        lib_path = os.path.join(build_dir, "libfib.so")
+        with open(src, "w") as f:
+            f.write(FIB_C)
+        try:
+            subprocess.run(["cc", "-O3", "-fPIC", "-shared", src, "-o", lib_path],
+                           check=True, capture_output=True)
+            lib = ctypes.CDLL(lib_path)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+    lib.fib.argtypes = [ctypes.c_int]
+    lib.fib.restype = ctypes.c_longlong
+    return lib.fib
+
+fib_native = _build_fib()
 
 n = 35
 iterations = 5
+warmup = 2
+
+def bench(fn, reset=None):
+    # Warm up at the real size so a JIT (PyPy, Numba) has profiled and
+    # compiled the hot path before the first timed iteration
+    for _ in range(warmup):
+        if reset is not None:
+            reset()
+        fn(n)
 
-times = []
-result = 0
-for i in range(iterations):
-    start = time.perf_counter()
-    result = fib(n)
-    elapsed = (time.perf_counter() - start) * 1000
-    times.append(elapsed)
+    times = []
+    result = 0
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            if reset is not None:
+                reset()
+            start = time.perf_counter()
+            result = fn(n)
+            elapsed = (time.perf_counter() - start) * 1000
+            times.append(elapsed)
+    finally:
+        gc.enable()
+    return result, times
+
+result, times = bench(fib)
 
 best = min(times)
-avg = sum(times) / len(times)
 print("BENCHMARK: fibonacci_recursive")
-print(f"n={n}, iterations={iterations}")
+print(f"n={n}, iterations={iterations}, warmup={warmup}")
 print(f"result={result}")
 print(f"best={best}ms")
-print(f"avg={avg}ms")
+
+# Variants (same recursion shape, reported after the baseline)
+# Cache is cleared before each iteration so every run re-does the recursion.
+memo_result, memo_times = bench(fib_memo, reset=fib_memo.cache_clear)
+print(f"  memoized: best={min(memo_times)}ms, result={memo_result}")
+
+doubling_result, doubling_times = bench(fib_doubling)
+print(f"  fast doubling: best={min(doubling_times)}ms, result={doubling_result}")
+
+if fib_native is not None:
+    native_result, native_times = bench(fib_native)
+    print(f"  native (ctypes): best={min(native_times)}ms, result={native_result}")
+
+if fib_jit is not None:
+    jit_result, jit_times = bench(fib_jit)
+    print(f"  numba: best={min(jit_times)}ms, result={jit_result}")
@@ -1,11 +1,83 @@
+import operator
 import time
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 n = 200
 iterations = 3
 
 mat_a = [[(i * n + j) % 100 for j in range(n)] for i in range(n)]
 mat_b = [[(i * n + j + 50) % 100 for j in range(n)] for i in range(n)]
 
+def matmul_transposed(mat_a, bt):
+    # bt is mat_b transposed, so each dot product walks two contiguous rows
+    result = [[sum(map(operator.mul, row, col)) for col in bt] for row in mat_a]
+    return result[0][0]
+
+def matmul_hoisted(mat_a, bt):
+    # Row references are bound once per loop level, leaving one load per operand
+    result = [[0] * n for _ in range(n)]
+    for i in range(n):
+        ai = mat_a[i]
+        ri = result[i]
+        for j in range(n):
+            btj = bt[j]
+            s = 0
+            for k in range(n):
+                s += ai[k] * btj[k]
+            ri[j] = s
+    return result[0][0]
+
+def matmul_np(a, b):
+    # Dispatches to the BLAS GEMM NumPy was built against
+    result = a @ b
+    return int(result[0, 0])
+
+# Tile sizes: three 64x64 float64 tiles are ~96 KB, which stays in L2
+MC = NC = KC = 64
+
+if np is not None and njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _matmul_tiled(a, b, c):
+        n = a.shape[0]
+        for bi in prange((n + MC - 1) // MC):
+            i0 = bi * MC
+            for j0 in range(0, n, NC):
+                for k0 in range(0, n, KC):
+                    for i in range(i0, min(i0 + MC, n)):
+                        for j in range(j0, min(j0 + NC, n)):
+                            acc = c[i, j]
+                            for k in range(k0, min(k0 + KC, n)):
+                                acc += a[i, k] * b[k, j]
+                            c[i, j] = acc
+
+    def matmul_tiled(a, b):
+        c = np.zeros_like(a)
+        _matmul_tiled(a, b, c)
+        return int(c[0, 0])
+else:
+    matmul_tiled = None
+
+def bench(fn, a, b):
+    times = []
+    checksum = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        checksum = fn(a, b)
+        elapsed = (time.perf_counter() - start) * 1000
+        times.append(elapsed)
+    return checksum, times
+
+# Headline loop stays at module scope (global lookups) so the number matches
+# the one compared against Tova and Go; variants below run inside functions
 times = []
 checksum = 0
 
@@ -31,3 +103,23 @@ print(f"size={n}x{n}, iterations={iterations}")
 print(f"checksum={checksum}")
 print(f"best={best}ms")
 print(f"avg={avg}ms")
+
+# Variants (reported after the baseline)
+mat_bt = [list(col) for col in zip(*mat_b)]
+t_checksum, t_times = bench(matmul_transposed, mat_a, mat_bt)
+print(f"  transposed: best={min(t_times)}ms, checksum={t_checksum}")
+h_checksum, h_times = bench(matmul_hoisted, mat_a, mat_bt)
+print(f"  hoisted: best={min(h_times)}ms, checksum={h_checksum}")
+
+if np is not None:
+    # Conversion happens once, outside the timed region
+    a = np.array(mat_a, dtype=np.float64)
+    b = np.array(mat_b, dtype=np.float64)
+    matmul_np(a, b)
+    np_checksum, np_times = bench(matmul_np, a, b)
+    print(f"  numpy: best={min(np_times)}ms, checksum={np_checksum}")
+
+if matmul_tiled is not None:
+    matmul_tiled(a, b)
+    tiled_checksum, tiled_times = bench(matmul_tiled, a, b)
+    print(f"  tiled (numba): best={min(tiled_times)}ms, checksum={tiled_checksum}")
@@ -1,6 +1,11 @@
 import time
 from functools import reduce
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def benchmark_map_filter_reduce(size):
     data = list(range(size))
 
@@ -13,6 +18,17 @@ def benchmark_map_filter_reduce(size):
     elapsed = (time.perf_counter() - start) * 1000
     print(f"  map/filter/reduce ({size} items): {elapsed}ms, result={result}")
 
+def benchmark_map_filter_reduce_np(size):
+    data = np.arange(size, dtype=np.int64)
+
+    start = time.perf_counter()
+
+    filtered = data[data % 3 != 0]
+    result = int((filtered * filtered).sum())
+
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  map/filter/reduce numpy ({size} items): {elapsed}ms, result={result}")
+
 def benchmark_sort(size):
     data = list(range(size, 0, -1))
 
@@ -36,6 +52,39 @@ def benchmark_find(size):
 
     print(f"  find x100 ({size} items): {elapsed}ms, found={found}")
 
+def benchmark_find_index(size):
+    data = list(range(size))
+    target = size - 1
+
+    start = time.perf_counter()
+    found = 0
+    for _ in range(100):
+        # list.index scans in C instead of resuming a generator per element
+        try:
+            data.index(target)
+        except ValueError:
+            pass
+        else:
+            found += 1
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"  find index x100 ({size} items): {elapsed}ms, found={found}")
+
+def benchmark_find_sorted_np(size):
+    data = np.arange(size, dtype=np.int64)
+    target = size - 1
+
+    start = time.perf_counter()
+    found = 0
+    for _ in range(100):
+        # data is sorted, so a binary search replaces the linear scan
+        i = data.searchsorted(target)
+        if i < size and data[i] == target:
+            found += 1
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"  find searchsorted x100 ({size} items): {elapsed}ms, found={found}")
+
 print("BENCHMARK: array_processing")
 
 benchmark_map_filter_reduce(100000)
@@ -44,3 +93,11 @@ benchmark_sort(100000)
 benchmark_sort(1000000)
 benchmark_find(100000)
 benchmark_find(1000000)
+benchmark_find_index(100000)
+benchmark_find_index(1000000)
+
+if np is not None:
+    benchmark_map_filter_reduce_np(100000)
+    benchmark_map_filter_reduce_np(1000000)
+    benchmark_find_sorted_np(100000)
+    benchmark_find_sorted_np(1000000)
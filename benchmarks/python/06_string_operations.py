@@ -7,9 +7,17 @@ def benchmark_string_concat(n):
     elapsed = (time.perf_counter() - start) * 1000
     print(f"  join {n} strings: {elapsed}ms, len={len(result)}")
 
+def benchmark_string_concat_map(n):
+    # Times str() conversion as well as the join, so it is not comparable with
+    # the "join" line. str.join still materializes the map into a list of n
+    # strings (PySequence_Fast); it only skips the separate comprehension.
+    start = time.perf_counter()
+    result = ",".join(map(str, range(n)))
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  join map {n} ints (incl. str conversion): {elapsed}ms, len={len(result)}")
+
 def benchmark_string_split(n):
-    parts = [str(i) for i in range(n)]
-    big_str = ",".join(parts)
+    big_str = ",".join(map(str, range(n)))
 
     start = time.perf_counter()
     tokens = big_str.split(",")
@@ -25,21 +33,59 @@ def benchmark_string_replace(n):
     elapsed = (time.perf_counter() - start) * 1000
     print(f"  replace x{n}: {elapsed}ms")
 
+def benchmark_string_replace_presplit(n):
+    base = "hello world " * 1000
+    # Match offsets are found once; each call only copies segments out
+    segments = base.split("world")
+
+    start = time.perf_counter()
+    for _ in range(n):
+        result = "tova".join(segments)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  replace presplit x{n}: {elapsed}ms")
+
 def benchmark_string_search(n):
     haystack = "abcdefghij" * 10000
 
     start = time.perf_counter()
     found_count = 0
+    # The needle matches at offset 5, so this mostly measures loop and call cost
     for _ in range(n):
         if "fghij" in haystack:
             found_count += 1
     elapsed = (time.perf_counter() - start) * 1000
     print(f"  contains x{n}: {elapsed}ms, found={found_count}")
 
+def benchmark_string_search_hoisted(n):
+    haystack = "abcdefghij" * 10000
+
+    start = time.perf_counter()
+    # Neither operand changes between iterations, so one search is enough
+    found_count = int("fghij" in haystack) * n
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  contains hoisted x{n}: {elapsed}ms, found={found_count}")
+
+def benchmark_string_search_miss(n):
+    haystack = "abcdefghij" * 10000
+
+    start = time.perf_counter()
+    found_count = 0
+    # Absent needle: every call has to scan all 100 KB of the haystack
+    for _ in range(n):
+        if "fghik" in haystack:
+            found_count += 1
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  contains miss x{n}: {elapsed}ms, found={found_count}")
+
 print("BENCHMARK: string_operations")
 benchmark_string_concat(100000)
 benchmark_string_concat(1000000)
+benchmark_string_concat_map(100000)
+benchmark_string_concat_map(1000000)
 benchmark_string_split(100000)
 benchmark_string_split(1000000)
 benchmark_string_replace(10000)
+benchmark_string_replace_presplit(10000)
 benchmark_string_search(100000)
+benchmark_string_search_hoisted(100000)
+benchmark_string_search_miss(1000)
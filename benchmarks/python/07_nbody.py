@@ -1,5 +1,20 @@
+import array
+import gc
 import time
 import math
+import platform
+
+np = njit = None
+# PyPy runs only the pure-Python paths; C extensions go through its slow cpyext layer
+if platform.python_implementation() != "PyPy":
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    try:
+        from numba import njit
+    except ImportError:
+        pass
 
 PI = 3.141592653589793
 SOLAR_MASS = 4.0 * PI * PI
@@ -46,6 +61,16 @@ bodies[0][VX] = -px / SOLAR_MASS
 bodies[0][VY] = -py / SOLAR_MASS
 bodies[0][VZ] = -pz / SOLAR_MASS
 
+# Flat copy of the initial state: body i occupies buf[i*STRIDE : i*STRIDE+7]
+STRIDE = 7
+buf0 = array.array("d", [v for b in bodies for v in b])
+
+# Structure-of-arrays copy of the initial state for the NumPy variant
+if np is not None:
+    pos0 = np.array([[b[X], b[Y], b[Z]] for b in bodies], dtype=np.float64)
+    vel0 = np.array([[b[VX], b[VY], b[VZ]] for b in bodies], dtype=np.float64)
+    mass = np.array([b[MASS] for b in bodies], dtype=np.float64)
+
 def energy(bodies):
     nbodies = len(bodies)
     e = 0.0
@@ -87,19 +112,168 @@ def advance(bodies, dt):
         b[Y] += dt * b[VY]
         b[Z] += dt * b[VZ]
 
-e_before = energy(bodies)
+def energy_flat(buf, nbodies):
+    e = 0.0
+    for i in range(nbodies):
+        bi = i * STRIDE
+        e += 0.5 * buf[bi + MASS] * (buf[bi + VX]**2 + buf[bi + VY]**2 + buf[bi + VZ]**2)
+        for j in range(i + 1, nbodies):
+            bj = j * STRIDE
+            dx = buf[bi + X] - buf[bj + X]
+            dy = buf[bi + Y] - buf[bj + Y]
+            dz = buf[bi + Z] - buf[bj + Z]
+            dist = math.sqrt(dx*dx + dy*dy + dz*dz)
+            e -= (buf[bi + MASS] * buf[bj + MASS]) / dist
+    return e
+
+def advance_flat(buf, nbodies, dt):
+    # Same loop as advance(), but over unboxed doubles in one contiguous block
+    for i in range(nbodies):
+        bi = i * STRIDE
+        for j in range(i + 1, nbodies):
+            bj = j * STRIDE
+            dx = buf[bi + X] - buf[bj + X]
+            dy = buf[bi + Y] - buf[bj + Y]
+            dz = buf[bi + Z] - buf[bj + Z]
+            dist_sq = dx*dx + dy*dy + dz*dz
+            dist = math.sqrt(dist_sq)
+            mag = dt / (dist_sq * dist)
+
+            mj = buf[bj + MASS] * mag
+            buf[bi + VX] -= dx * mj
+            buf[bi + VY] -= dy * mj
+            buf[bi + VZ] -= dz * mj
+
+            mi = buf[bi + MASS] * mag
+            buf[bj + VX] += dx * mi
+            buf[bj + VY] += dy * mi
+            buf[bj + VZ] += dz * mi
+
+    for bi in range(0, nbodies * STRIDE, STRIDE):
+        buf[bi + X] += dt * buf[bi + VX]
+        buf[bi + Y] += dt * buf[bi + VY]
+        buf[bi + Z] += dt * buf[bi + VZ]
+
+def energy_np(pos, vel, mass):
+    e = 0.5 * (mass * (vel * vel).sum(1)).sum()
+    i, j = np.triu_indices(len(mass), 1)
+    dist = np.sqrt(((pos[i] - pos[j]) ** 2).sum(1))
+    return float(e - (mass[i] * mass[j] / dist).sum())
+
+def advance_np(pos, vel, mass, dt, eye):
+    # dx[i, j] = pos[i] - pos[j]; the diagonal is padded so it divides cleanly
+    dx = pos[:, None, :] - pos[None, :, :]
+    d2 = (dx * dx).sum(-1) + eye
+    mag = dt / (d2 * np.sqrt(d2))
+    vel -= np.einsum("ijk,j,ij->ik", dx, mass, mag)
+    pos += dt * vel
+
+if np is not None and njit is not None:
+    @njit(fastmath=True, cache=True)
+    def energy_jit(pos, vel, mass):
+        n = pos.shape[0]
+        e = 0.0
+        for i in range(n):
+            e += 0.5 * mass[i] * (vel[i, 0]**2 + vel[i, 1]**2 + vel[i, 2]**2)
+            for j in range(i + 1, n):
+                dx = pos[i, 0] - pos[j, 0]
+                dy = pos[i, 1] - pos[j, 1]
+                dz = pos[i, 2] - pos[j, 2]
+                e -= (mass[i] * mass[j]) / math.sqrt(dx*dx + dy*dy + dz*dz)
+        return e
+
+    @njit(fastmath=True, cache=True)
+    def advance_jit(pos, vel, mass, dt):
+        n = pos.shape[0]
+        for i in range(n):
+            for j in range(i + 1, n):
+                dx = pos[i, 0] - pos[j, 0]
+                dy = pos[i, 1] - pos[j, 1]
+                dz = pos[i, 2] - pos[j, 2]
+                # One reciprocal sqrt and multiplies instead of a divide;
+                # with fastmath LLVM may lower this to rsqrt + Newton step
+                inv_d = 1.0 / math.sqrt(dx*dx + dy*dy + dz*dz)
+                mag = dt * inv_d * inv_d * inv_d
+
+                vel[i, 0] -= dx * mass[j] * mag
+                vel[i, 1] -= dy * mass[j] * mag
+                vel[i, 2] -= dz * mass[j] * mag
+
+                vel[j, 0] += dx * mass[i] * mag
+                vel[j, 1] += dy * mass[i] * mag
+                vel[j, 2] += dz * mass[i] * mag
+
+        for i in range(n):
+            pos[i, 0] += dt * vel[i, 0]
+            pos[i, 1] += dt * vel[i, 1]
+            pos[i, 2] += dt * vel[i, 2]
+
+    @njit(cache=True)
+    def run_jit(pos, vel, mass, dt, steps):
+        # Keeps the step loop native too, so no per-step dispatch from Python
+        for _ in range(steps):
+            advance_jit(pos, vel, mass, dt)
+else:
+    run_jit = None
 
 steps = 500000
+warmup = 2
+warmup_steps = 10000
 
+# Warm up on a scratch copy so a JIT (PyPy) has compiled advance() before
+# timing, without disturbing the state the timed run starts from
+for _ in range(warmup):
+    scratch = [b[:] for b in bodies]
+    for _ in range(warmup_steps):
+        advance(scratch, 0.01)
+
+e_before = energy(bodies)
+
+gc.disable()
 start = time.perf_counter()
 for _ in range(steps):
     advance(bodies, 0.01)
 elapsed = (time.perf_counter() - start) * 1000
+gc.enable()
 
 e_after = energy(bodies)
 
 print("BENCHMARK: nbody")
-print(f"steps={steps}")
+print(f"steps={steps}, warmup={warmup}x{warmup_steps}")
 print(f"energy_before={e_before}")
 print(f"energy_after={e_after}")
 print(f"time={elapsed}ms")
+
+# Variants (reported after the baseline)
+buf = array.array("d", buf0)
+nbodies = len(bodies)
+flat_before = energy_flat(buf, nbodies)
+gc.disable()
+start = time.perf_counter()
+for _ in range(steps):
+    advance_flat(buf, nbodies, 0.01)
+flat_elapsed = (time.perf_counter() - start) * 1000
+gc.enable()
+print(f"  array.array: time={flat_elapsed}ms, energy_before={flat_before}, energy_after={energy_flat(buf, nbodies)}")
+
+if np is not None:
+    pos, vel = pos0.copy(), vel0.copy()
+    eye = np.eye(len(mass))
+    np_before = energy_np(pos, vel, mass)
+    gc.disable()
+    start = time.perf_counter()
+    for _ in range(steps):
+        advance_np(pos, vel, mass, 0.01, eye)
+    np_elapsed = (time.perf_counter() - start) * 1000
+    gc.enable()
+    print(f"  numpy: time={np_elapsed}ms, energy_before={np_before}, energy_after={energy_np(pos, vel, mass)}")
+
+if run_jit is not None:
+    pos, vel = pos0.copy(), vel0.copy()
+    # Warmup on a scratch copy so compilation stays out of the timed region
+    run_jit(pos0.copy(), vel0.copy(), mass, 0.01, 1)
+    jit_before = energy_jit(pos, vel, mass)
+    start = time.perf_counter()
+    run_jit(pos, vel, mass, 0.01, steps)
+    jit_elapsed = (time.perf_counter() - start) * 1000
+    print(f"  numba: time={jit_elapsed}ms, energy_before={jit_before}, energy_after={energy_jit(pos, vel, mass)}")
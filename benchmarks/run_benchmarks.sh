@@ -11,6 +11,7 @@ set -e
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 ROOT_DIR="$(cd "$SCRIPT_DIR/.." && pwd)"
 PY_DIR="$SCRIPT_DIR/python"
+PYPY="$(command -v pypy3 || true)"
 GO_DIR="$SCRIPT_DIR/go"
 
 # Parse flags
@@ -33,6 +34,9 @@ echo "  Bun: $(bun --version 2>/dev/null || echo 'N/A')"
 if [ "$TOVA_ONLY" = false ]; then
     echo "  Go: $(go version 2>/dev/null | awk '{print $3}' || echo 'N/A')"
     echo "  Python: $(python3 --version 2>&1 | awk '{print $2}' || echo 'N/A')"
+    if [ -n "$PYPY" ]; then
+        echo "  PyPy: $("$PYPY" -c 'import sys; print(".".join(map(str, sys.pypy_version_info[:3])))' 2>/dev/null || echo 'N/A')"
+    fi
 fi
 echo "============================================================"
 echo ""
@@ -55,6 +59,12 @@ ALL_BENCHMARKS=(
     "14_typed_arrays"
 )
 
+# Pure-Python numeric benchmarks that are also run under PyPy's tracing JIT
+PYPY_BENCHMARKS=(
+    "01_fibonacci_recursive"
+    "07_nbody"
+)
+
 # Select benchmarks to run
 if [ -n "$SINGLE" ]; then
     BENCHMARKS=()
@@ -96,6 +106,7 @@ declare -a NAMES
 declare -a TOVA_TIMES
 declare -a GO_TIMES
 declare -a PY_TIMES
+declare -a PYPY_TIMES
 
 extract_time() {
     local out="$1"
@@ -161,10 +172,21 @@ for bench in "${BENCHMARKS[@]}"; do
         py_time=$(extract_time "$py_output")
     fi
 
+    # --- PyPy ---
+    pypy_output=""
+    pypy_time=""
+    if [ "$TOVA_ONLY" = false ] && [ -n "$PYPY" ] && [[ " ${PYPY_BENCHMARKS[*]} " == *" $bench "* ]]; then
+        echo "  [PyPy]"
+        pypy_output=$("$PYPY" "$PY_DIR/${bench}.py" 2>/dev/null) || true
+        echo "$pypy_output" | sed 's/^/    /'
+        pypy_time=$(extract_time "$pypy_output")
+    fi
+
     NAMES+=("$bench")
     TOVA_TIMES+=("$tova_time")
     GO_TIMES+=("$go_time")
     PY_TIMES+=("$py_time")
+    PYPY_TIMES+=("$pypy_time")
     echo ""
 done
 
@@ -234,6 +256,27 @@ if [ "$TOVA_ONLY" = false ] && [ $total_compared -gt 0 ]; then
 fi
 echo ""
 
+# CPython vs PyPy for the benchmarks run under both
+if [ "$TOVA_ONLY" = false ] && [ -n "$PYPY" ]; then
+    printf "%-30s %12s %12s %10s\n" "Benchmark" "CPython (ms)" "PyPy (ms)" "Speedup"
+    printf "%-30s %12s %12s %10s\n" "------------------------------" "------------" "------------" "----------"
+    for i in "${!NAMES[@]}"; do
+        pt="${PY_TIMES[$i]}"
+        ppt="${PYPY_TIMES[$i]}"
+        [ -z "$ppt" ] && continue
+        speedup=""
+        if [ -n "$pt" ]; then
+            speedup=$(echo "scale=2; $pt / $ppt" | bc 2>/dev/null || echo "")
+        fi
+        printf "%-30s %12s %12s %10s\n" \
+            "${NAMES[$i]}" \
+            "${pt:-N/A}" \
+            "$ppt" \
+            "${speedup:+${speedup}x}"
+    done
+    echo ""
+fi
+
 # Cleanup
 if [ "$TOVA_ONLY" = false ]; then
     rm -rf "$GO_BINS"